@@ -34,7 +34,9 @@ class BaseEstimator(_BaseEstimator):
         NotFittedError
             If the estimator has not been fitted yet.
         """
-        if not self.is_fitted:
+        # read the attribute directly rather than through the `is_fitted`
+        # property, as this is called on every predict and update
+        if not self._is_fitted:
             raise NotFittedError(
                 f"This instance of {self.__class__.__name__} has not "
                 f"been fitted yet; please call `fit` first.")
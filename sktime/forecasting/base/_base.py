@@ -66,7 +66,8 @@ class BaseForecaster(BaseEstimator):
         """
         raise NotImplementedError("abstract method")
 
-    def compute_pred_int(self, y_pred, alpha=DEFAULT_ALPHA):
+    def compute_pred_int(self, y_pred, alpha=DEFAULT_ALPHA,
+                         return_alpha=False):
         """
         Get the prediction intervals for a forecast.
 
@@ -81,9 +82,17 @@ class BaseForecaster(BaseEstimator):
         alpha : float or list, optional (default=0.95)
             A significance level or list of significance levels.
 
+        return_alpha : bool, optional (default=False)
+            If True, also return the significance levels, sorted in
+            ascending order, with the intervals in the same order.
+
         Returns
         -------
 
+        alphas : float or list
+            The significance levels in ascending order, only returned if
+            ``return_alpha`` is True.
+
         intervals : pd.DataFrame
             A table of upper and lower bounds for each point prediction in
             ``y_pred``. If ``alpha`` was iterable, then ``intervals`` will be a
@@ -16,7 +16,9 @@ from sktime.forecasting.model_selection import CutoffSplitter
 from sktime.forecasting.model_selection import SlidingWindowSplitter
 from sktime.utils.validation.forecasting import check_alpha
 from sktime.utils.validation.forecasting import check_cv
+from sktime.utils.validation.forecasting import check_equal_time_index
 from sktime.utils.validation.forecasting import check_fh
+from sktime.utils.validation.forecasting import check_X
 from sktime.utils.validation.forecasting import check_y
 from sktime.utils.validation.forecasting import check_y_X
 
@@ -28,6 +30,7 @@ class BaseSktimeForecaster(BaseForecaster):
         # training data
         self._y = None
         self._X = None
+        self._is_trusted_y = False  # whether to skip input checks of y
 
         # forecasting horizon
         self._fh = None
@@ -60,18 +63,165 @@ class BaseSktimeForecaster(BaseForecaster):
         X : pd.DataFrame, optional (default=None)
             Exogenous time series
         """
-        # update only for non-empty data
-        y, X = check_y_X(y, X=X, allow_empty=True)
+        # in trusted mode, y is a window of data which has been checked
+        # already, so only X needs to be checked
+        if self._is_trusted_y:
+            if X is not None:
+                X = check_X(X)
+                check_equal_time_index(y, X)
+        else:
+            y, X = check_y_X(y, X=X, allow_empty=True)
 
+        # update only for non-empty data
         if len(y) > 0:
-            self._y = y.combine_first(self._y)
+            # split y into time points up to the end of the observed data
+            # and new time points after it
+            last = self._y_index[self._n_timepoints - 1]
+            n_observed = y.index.searchsorted(last, side="right")
+
+            if n_observed == 0 or self._is_observed(y.iloc[:n_observed]):
+                # if new data follows the observed data, possibly
+                # overlapping with already observed values, we simply append
+                # the new time points to the buffer of observed data, so
+                # that repeated updates do not copy the whole series
+                if n_observed < len(y):
+                    self._append_y(y.iloc[n_observed:])
+            else:
+                # otherwise, if new data fills gaps in or conflicts with the
+                # observed data, combine both
+                self._y = y.combine_first(self._y)
 
             # set cutoff to the end of the observation horizon
             self._set_cutoff(y.index[-1])
 
-            # update X if given
+            # update X if given, again only checking the boundary between
+            # observed and new time points instead of re-sorting the union;
+            # columns must match, as combine_first sorts differing columns
             if X is not None:
-                self._X = X.combine_first(self._X)
+                if (self._X is not None
+                        and X.index[0] > self._X.index[-1]
+                        and X.columns.equals(self._X.columns)):
+                    X = pd.concat([self._X, X])
+                    # cast columns to float, as when combining frames with
+                    # combine_first
+                    dtypes = X.dtypes.map(
+                        lambda dtype: np.result_type(dtype, np.float64))
+                    if not dtypes.equals(X.dtypes):
+                        X = X.astype(dtypes.to_dict())
+                    self._X = X
+                else:
+                    self._X = X.combine_first(self._X)
+
+    def _is_observed(self, y):
+        """Check if all values of y have been observed already.
+
+        This is the case when already seen data is passed again,
+        for example when making in-sample predictions, in which case there
+        is no need to update the observed data.
+
+        Parameters
+        ----------
+        y : pd.Series
+
+        Returns
+        -------
+        is_observed : bool
+        """
+        # check bounds first, which is cheap and does not require
+        # slicing the observed data
+        if (y.index[0] < self._y_index[0]
+                or y.index[-1] > self._y_index[self._n_timepoints - 1]):
+            return False
+        # compare against the observed window only; with a monotonic index,
+        # the window has the same time points as y if all have been
+        # observed without duplicates
+        lower, upper = self._locate_y_window(y.index[0], y.index[-1])
+        if upper - lower != len(y):
+            return False
+        index = self._y_index[lower:upper]
+        values = self._y_values[lower:upper]
+        y_values = y.to_numpy()
+        return np.array_equal(index, y.index) and bool(np.all(
+            (values == y_values) | (pd.isnull(values) & pd.isnull(y_values))))
+
+    def _locate_y_window(self, start, end):
+        """Locate observed time points from start to end (inclusive)
+
+        Parameters
+        ----------
+        start : int
+        end : int
+
+        Returns
+        -------
+        lower : int
+        upper : int
+            Integer locations of the window in the observed data
+        """
+        index = self._y_index[:self._n_timepoints]
+        lower = index.searchsorted(start, side="left")
+        upper = index.searchsorted(end, side="right")
+        return lower, upper
+
+    def _append_y(self, y):
+        """Append new time points to the observed data.
+
+        The observed values and time points are kept in buffers which grow
+        by doubling their capacity, so that appending takes amortized
+        constant time per time point.
+
+        Parameters
+        ----------
+        y : pd.Series
+            New time points after the end of the observed data
+        """
+        n_timepoints = self._n_timepoints + len(y)
+        if n_timepoints > len(self._y_values):
+            capacity = max(n_timepoints, 2 * len(self._y_values))
+            # values are cast to float, as when combining series with
+            # combine_first
+            values = np.empty(capacity, dtype=np.result_type(
+                self._y_values.dtype, y.dtype, np.float64))
+            index = np.empty(capacity, dtype=np.result_type(
+                self._y_index.dtype, y.index.dtype))
+            values[:self._n_timepoints] = self._y_values[:self._n_timepoints]
+            index[:self._n_timepoints] = self._y_index[:self._n_timepoints]
+            self._y_values, self._y_index = values, index
+
+        self._y_values[self._n_timepoints:n_timepoints] = y.to_numpy()
+        self._y_index[self._n_timepoints:n_timepoints] = y.index
+        self._n_timepoints = n_timepoints
+        self._y_cache = None
+
+    @property
+    def _y(self):
+        """The observed endogenous time series
+
+        Returns
+        -------
+        y : pd.Series or None
+        """
+        # return the series as set, if no time points have been appended
+        # since, otherwise construct it from the filled part of the buffers
+        # without storing it, so that reading it does not change the state
+        if self._y_cache is not None or self._n_timepoints == 0:
+            return self._y_cache
+        return pd.Series(self._y_values[:self._n_timepoints],
+                         index=self._y_index[:self._n_timepoints],
+                         name=self._y_name)
+
+    @_y.setter
+    def _y(self, y):
+        # overwrite all previously observed data
+        self._y_cache = y
+        if y is None:
+            self._y_values = self._y_index = self._y_name = None
+            self._n_timepoints = 0
+        else:
+            self._y_values = y.to_numpy()
+            self._y_index = y.index.to_numpy()
+            self._y_name = y.name
+            self._n_timepoints = len(y)
 
     @property
     def cutoff(self):
@@ -108,6 +258,23 @@ class BaseSktimeForecaster(BaseForecaster):
             # re-set cutoff to initial value
             self._set_cutoff(cutoff)
 
+    @contextmanager
+    def _trusted_y(self):
+        """When in trusted y mode, input checks of y are skipped when
+        updating the observed data.
+
+        This is useful during rolling-cutoff forecasts when windows of a
+        series which has already been checked are repeatedly passed to
+        `update`.
+        """
+        is_trusted_y = self._is_trusted_y  # keep initial mode
+        self._is_trusted_y = True
+        try:
+            yield
+        finally:
+            # re-set mode to initial value
+            self._is_trusted_y = is_trusted_y
+
     @property
     def fh(self):
         """The forecasting horizon"""
@@ -159,7 +326,8 @@ class BaseSktimeForecaster(BaseForecaster):
         return self._predict(self.fh, X=X, return_pred_int=return_pred_int,
                              alpha=alpha)
 
-    def compute_pred_int(self, y_pred, alpha=DEFAULT_ALPHA):
+    def compute_pred_int(self, y_pred, alpha=DEFAULT_ALPHA,
+                         return_alpha=False):
         """
         Get the prediction intervals for a forecast. Must be run *after* the
         forecaster has been fitted.
@@ -175,32 +343,59 @@ class BaseSktimeForecaster(BaseForecaster):
         alpha : float or list, optional (default=0.95)
             A significance level or list of significance levels.
 
+        return_alpha : bool, optional (default=False)
+            If True, also return the significance levels, sorted in
+            ascending order, with the intervals in the same order.
+
         Returns
         -------
 
+        alphas : float or list
+            The significance levels in ascending order, only returned if
+            ``return_alpha`` is True.
+
         intervals : pd.DataFrame
             A table of upper and lower bounds for each point prediction in
             ``y_pred``. If ``alpha`` was iterable, then ``intervals`` will be a
-            list of such tables.
+            list of such tables, in the order of the given ``alpha`` values
+            or in ascending order if ``return_alpha`` is True.
         """
 
         alphas = check_alpha(alpha)
+
+        # compute errors in ascending order of alpha, keeping track of the
+        # order in which alphas were passed
+        order = np.argsort(alphas, kind="stable")
+        alphas = [alphas[i] for i in order]
         errors = self._compute_pred_err(alphas)
 
-        # compute prediction intervals
+        # compute prediction intervals for all alphas at once by
+        # broadcasting the point predictions against the errors, with one
+        # column per alpha
+        y_pred_values = y_pred.to_numpy()[:, np.newaxis]
+        lower = y_pred_values - errors
+        upper = y_pred_values + errors
+
         pred_int = [
             pd.DataFrame({
-                "lower": y_pred - error,
-                "upper": y_pred + error
-            })
-            for error in errors
+                "lower": lower[:, i],
+                "upper": upper[:, i]
+            }, index=y_pred.index)
+            for i in range(errors.shape[1])
         ]
 
         # for a single alpha, return single pd.DataFrame
-        if isinstance(alpha, float):
-            return pred_int[0]
+        if np.ndim(alpha) == 0:
+            alphas = alphas[0]
+            pred_int = pred_int[0]
 
-        # otherwise return list of pd.DataFrames
+        # otherwise return list of pd.DataFrames, restoring the order of
+        # the given alphas unless sorted alphas are returned with them
+        elif not return_alpha:
+            pred_int = [pred_int[i] for i in np.argsort(order)]
+
+        if return_alpha:
+            return alphas, pred_int
         return pred_int
 
     def _compute_pred_err(self, alphas):
@@ -209,15 +404,15 @@ class BaseSktimeForecaster(BaseForecaster):
         Parameters
         ----------
 
-        alpha : float or list, optional (default=0.95)
-            A significance level or list of significance levels.
+        alphas : list of float
+            Significance levels, sorted in ascending order.
 
         Returns
         -------
 
-        errors : list of pd.Series
-            Each series in the list will contain the errors for each point in
-            the forecast for the corresponding alpha.
+        errors : np.array, shape=[len(fh), len(alphas)]
+            The errors for each point in the forecast, with one column for
+            each alpha.
         """
         raise NotImplementedError("abstract method")
 
@@ -342,16 +537,35 @@ class BaseSktimeForecaster(BaseForecaster):
             raise NotImplementedError()
 
         fh = cv.get_fh()
-        y_preds = []
-        cutoffs = []
 
-        # enter into a detached cutoff mode
-        with self._detached_cutoff():
+        # splitting only requires the time index, not the values; splits
+        # are only counted in a separate pass over the splitter if it does
+        # not implement get_n_splits
+        y_index = y.index
+        try:
+            n_splits = cv.get_n_splits(y_index)
+        except NotImplementedError:
+            n_splits = sum(1 for _ in cv.split(y_index))
+
+        # preallocate point predictions and their time points, with one
+        # column per cutoff
+        y_preds = np.full((len(fh), n_splits), np.nan)
+        y_pred_index = np.empty((len(fh), n_splits), dtype=y.index.dtype)
+        cutoffs = [None] * n_splits
+
+        # windows are integer-location based, so we can index the
+        # underlying arrays directly instead of going through pandas indexing
+        y_values = y.to_numpy()
+
+        # enter into a detached cutoff mode, skipping input checks for
+        # windows of y, which has been checked already
+        with self._detached_cutoff(), self._trusted_y():
             # set cutoff to time point before data
             self._set_cutoff(y.index[0] - 1)
             # iterate over data
-            for new_window, _ in cv.split(y):
-                y_new = y.iloc[new_window]
+            for i, (new_window, _) in enumerate(cv.split(y_index)):
+                y_new = pd.Series(y_values[new_window],
+                                  index=y_index[new_window], name=y.name)
 
                 # we cannot use update_predict_single here, as this would
                 # re-set the forecasting horizon, instead we use
@@ -361,9 +575,11 @@ class BaseSktimeForecaster(BaseForecaster):
                     update_params=update_params,
                     return_pred_int=return_pred_int,
                     alpha=alpha)
-                y_preds.append(y_pred)
-                cutoffs.append(self.cutoff)
-        return _format_moving_cutoff_predictions(y_preds, cutoffs)
+                y_preds[:, i] = y_pred.to_numpy()
+                y_pred_index[:, i] = y_pred.index
+                cutoffs[i] = self.cutoff
+        return _format_moving_cutoff_predictions(y_preds, y_pred_index,
+                                                 cutoffs)
 
     def _predict(self, fh, X=None, return_pred_int=False, alpha=DEFAULT_ALPHA):
         """Internal predict
@@ -410,6 +626,10 @@ class OptionalForecastingHorizonMixin:
                         "but was found in neither.")
                 # otherwise if no fh passed, but there is one already,
                 # we can simply use that one
+        elif fh is self._fh:
+            # if the already set fh is passed again, it has been validated
+            # already and there is nothing to update
+            pass
         else:
             # if fh is passed, validate first, then check if there is one
             # already,
@@ -457,6 +677,10 @@ class RequiredForecastingHorizonMixin:
                     "The forecasting horizon `fh` must be passed to "
                     "`fit`, "
                     "but none was found. " + msg)
+        elif fh is self._fh:
+            # if the already set fh is passed again, it has been validated
+            # and matches the one seen in `fit`
+            pass
         else:
             fh = check_fh(fh)
             if is_fitted:
@@ -502,6 +726,7 @@ class BaseWindowForecaster(BaseSktimeForecaster):
         -------
         y_pred : pd.Series or pd.DataFrame
         """
+        y_test = check_y(y_test)
         cv = check_cv(cv) if cv is not None else SlidingWindowSplitter(
             self.fh, window_length=self.window_length_)
         return self._predict_moving_cutoff(y_test, cv, X=X_test,
@@ -532,7 +757,12 @@ class BaseWindowForecaster(BaseSktimeForecaster):
         else:
             y_ins = self._predict_in_sample(fh_ins, **kwargs)
             y_oos = self._predict_fixed_cutoff(fh_oos, **kwargs)
-            return y_ins.append(y_oos)
+
+            # in-sample time points come first, so we can concatenate
+            # the values and indices directly into a single series
+            values = np.concatenate([y_ins.to_numpy(), y_oos.to_numpy()])
+            index = np.concatenate([y_ins.index, y_oos.index])
+            return pd.Series(values, index=index)
 
     def _predict_fixed_cutoff(self, fh, X=None, return_pred_int=False,
                               alpha=DEFAULT_ALPHA):
@@ -609,13 +839,15 @@ class BaseWindowForecaster(BaseSktimeForecaster):
         start = self.cutoff - self.window_length_ + 1
         end = self.cutoff
 
-        # get the last window of the endogenous variable
-        y = self._y.loc[start:end].to_numpy()
+        # get the last window of the endogenous variable, directly from the
+        # buffer of observed values
+        lower, upper = self._locate_y_window(start, end)
+        y = self._y_values[lower:upper]
 
         # if exogenous variables are given, also get the last window of
         # those
         if self._X is not None:
-            X = self._X.loc[start:end].to_numpy()
+            X = _slice_monotonic(self._X, start, end).to_numpy()
         else:
             X = None
         return y, X
@@ -653,20 +885,60 @@ class BaseWindowForecaster(BaseSktimeForecaster):
                              alpha=alpha)
 
 
-def _format_moving_cutoff_predictions(y_preds, cutoffs):
-    """Format moving-cutoff predictions"""
-    if not isinstance(y_preds, list):
+def _slice_monotonic(y, start, end):
+    """Select time points from start to end (inclusive)
+
+    Time indices are monotonic, so we can locate the window by binary search
+    rather than by label, which would require building a hash table for
+    each new index.
+
+    Parameters
+    ----------
+    y : pd.Series or pd.DataFrame
+    start : int
+    end : int
+
+    Returns
+    -------
+    y : pd.Series or pd.DataFrame
+    """
+    lower = y.index.searchsorted(start, side="left")
+    upper = y.index.searchsorted(end, side="right")
+    return y.iloc[lower:upper]
+
+
+def _format_moving_cutoff_predictions(y_preds, y_index, cutoffs):
+    """Format moving-cutoff predictions
+
+    Parameters
+    ----------
+    y_preds : np.array, shape=[len(fh), n_cutoffs]
+        Point predictions, with one column per cutoff
+    y_index : np.array, shape=[len(fh), n_cutoffs]
+        Time points of the point predictions
+    cutoffs : list
+        Cutoffs at which predictions were made
+
+    Returns
+    -------
+    y_pred : pd.Series or pd.DataFrame
+    """
+    if not isinstance(y_preds, np.ndarray) or y_preds.ndim != 2:
         raise ValueError(
-            f"`y_preds` must be a list, but found: {type(y_preds)}")
+            f"`y_preds` must be a 2d np.array, but found: {type(y_preds)}")
 
-    if len(y_preds[0]) == 1:
+    if y_preds.shape[0] == 1:
         # return series for single step ahead predictions
-        return pd.concat(y_preds)
+        return pd.Series(y_preds[0], index=y_index[0])
 
     else:
-        # return data frame when we predict multiple steps ahead
-        y_pred = pd.DataFrame(y_preds).T
-        y_pred.columns = cutoffs
+        # return data frame when we predict multiple steps ahead, with one
+        # row per predicted time point and one column per cutoff
+        index = np.unique(y_index)
+        y_pred = np.full((len(index), y_preds.shape[1]), np.nan)
+        rows = np.searchsorted(index, y_index)
+        y_pred[rows, np.arange(y_preds.shape[1])] = y_preds
+        y_pred = pd.DataFrame(y_pred, index=index, columns=cutoffs)
         if y_pred.shape[1] == 1:
             return y_pred.iloc[:, 0]
         return y_pred
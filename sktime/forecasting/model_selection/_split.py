@@ -19,6 +19,7 @@ from sktime.utils.validation.forecasting import check_window_length
 DEFAULT_STEP_LENGTH = 1
 DEFAULT_WINDOW_LENGTH = 10
 DEFAULT_FH = 1
+SPLIT_BLOCK_SIZE = 1024  # number of split points computed at once
 
 
 class BaseSplitter:
@@ -47,9 +48,9 @@ class BaseSplitter:
         Yields
         ------
         training_window : np.array
-            Training window indices
+            Training window indices, integer-location based
         test_window : np.array
-            Test window indices
+            Test window indices, integer-location based
         """
         y = self._check_y(y)
         for training_window, test_window in self._split_windows(y):
@@ -190,11 +191,20 @@ class SlidingWindowSplitter(BaseWindowSplitter):
 
         end = self._get_end(y)
         start = self._get_start()
-        for split_point in range(start, end, step_length):
-            training_window = np.arange(split_point - window_length,
-                                        split_point)
-            test_window = split_point + fh - 1
-            yield training_window, test_window
+
+        # compute windows in blocks of split points, with one row per split
+        # point, so that memory stays bounded for long series
+        training_offsets = np.arange(-window_length, 0)
+        test_offsets = np.asarray(fh) - 1
+        for block_start in range(start, end, SPLIT_BLOCK_SIZE * step_length):
+            block_end = min(block_start + SPLIT_BLOCK_SIZE * step_length, end)
+            split_points = np.arange(block_start, block_end,
+                                     step_length)[:, np.newaxis]
+            training_windows = split_points + training_offsets
+            test_windows = split_points + test_offsets
+            for training_window, test_window in zip(training_windows,
+                                                    test_windows):
+                yield training_window, test_window
 
     def split_initial(self, y):
         """Split initial window
@@ -9,6 +9,7 @@ import pytest
 from sktime.forecasting.model_selection import CutoffSplitter
 from sktime.forecasting.model_selection import SingleWindowSplitter
 from sktime.forecasting.model_selection import SlidingWindowSplitter
+from sktime.forecasting.model_selection import _split
 from sktime.forecasting.tests import TEST_FHS
 from sktime.forecasting.tests import TEST_STEP_LENGTHS
 from sktime.forecasting.tests import TEST_WINDOW_LENGTHS
@@ -235,3 +236,25 @@ def test_sliding_window_split_start_with_fh(y, fh, window_length, step_length):
 
     # check test windows
     check_test_windows(test_windows, fh, cutoffs)
+
+
+@pytest.mark.parametrize("y", TEST_YS)
+@pytest.mark.parametrize("step_length", TEST_STEP_LENGTHS)
+@pytest.mark.parametrize("start_with_window", [True, False])
+def test_sliding_window_split_blocks(y, step_length, start_with_window,
+                                     monkeypatch):
+    cv = SlidingWindowSplitter(fh=[1, 3], window_length=5,
+                               step_length=step_length,
+                               start_with_window=start_with_window)
+    expected = list(cv.split(y))
+
+    # windows computed in small blocks of split points are the same
+    monkeypatch.setattr(_split, "SPLIT_BLOCK_SIZE", 2)
+    actual = list(cv.split(y))
+    assert len(actual) == len(expected)
+    for (training_window, test_window), (expected_training_window,
+                                         expected_test_window) in zip(
+            actual, expected):
+        np.testing.assert_array_equal(training_window,
+                                      expected_training_window)
+        np.testing.assert_array_equal(test_window, expected_test_window)
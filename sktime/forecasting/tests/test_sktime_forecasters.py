@@ -10,11 +10,19 @@ __all__ = [
     "test_fh_in_fit_opt",
     "test_fh_in_fit_req",
     "test_fh_in_predict_opt",
+    "test_in_sample_predict_does_not_change_state",
+    "test_in_sample_predict_keeps_y",
     "test_no_fh_in_fit_req",
     "test_no_fh_opt",
     "test_oh_setting",
+    "test_overlapping_windows_append_to_y_buffer",
     "test_same_fh_in_fit_and_predict_opt",
     "test_same_fh_in_fit_and_predict_req",
+    "test_trusted_y_restored_after_update_predict",
+    "test_untrusted_update_rejects_unsorted_index",
+    "test_update_predict_without_get_n_splits",
+    "test_X_update_matches_combine_first",
+    "test_y_update_matches_combine_first",
 ]
 
 import numpy as np
@@ -23,7 +31,9 @@ import pytest
 from sktime.forecasting.base._sktime import BaseSktimeForecaster
 from sktime.forecasting.base._sktime import OptionalForecastingHorizonMixin
 from sktime.forecasting.base._sktime import RequiredForecastingHorizonMixin
+from sktime.forecasting.model_selection import SlidingWindowSplitter
 from sktime.forecasting.model_selection import temporal_train_test_split
+from sktime.forecasting.naive import NaiveForecaster
 from sktime.utils import all_estimators
 from sktime.utils._testing import _construct_instance
 from sktime.utils._testing.forecasting import make_forecasting_problem
@@ -144,3 +154,133 @@ def test_same_fh_in_fit_and_predict_opt(Forecaster):
     f.fit(y_train, FH0)
     f.predict(FH0)
     np.testing.assert_array_equal(f.fh, FH0)
+
+
+# test updating the observed data
+def test_y_update_matches_combine_first():
+    f = NaiveForecaster(strategy="mean", window_length=5)
+    f.fit(y.iloc[:20])
+    expected = y.iloc[:20]
+
+    updates = [
+        y.iloc[20:25],  # strictly appended
+        y.iloc[22:30],  # overlapping with observed tail
+        y.iloc[30:31],  # strictly appended single time point
+        y.iloc[10:15],  # in-sample replay
+        y.iloc[27:35],  # overlapping spanning multiple chunks
+        y.iloc[40:45],  # appended after a gap in time points
+        y.iloc[32:38] + 1,  # conflicting with observed values
+        y.iloc[0:45],  # replay of all data
+    ]
+    for y_new in updates:
+        f.update(y_new)
+        expected = y_new.combine_first(expected)
+
+        # check locating windows in the observed data
+        start, end = expected.index[-5], expected.index[-1]
+        lower, upper = f._locate_y_window(start, end)
+        np.testing.assert_array_equal(f._y.iloc[lower:upper],
+                                      expected.loc[start:end])
+
+        assert f._n_timepoints == len(expected)
+        assert f._y.dtype == expected.dtype
+        np.testing.assert_array_equal(f._y.index, expected.index)
+        np.testing.assert_array_equal(f._y.values, expected.values)
+
+
+def test_overlapping_windows_append_to_y_buffer():
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train, fh=1)
+
+    # overlapping windows only append new time points to the observed
+    # data, which must give the same result as combining them
+    cv = SlidingWindowSplitter(fh=1, window_length=10)
+    f.update_predict(y_test, cv=cv)
+
+    expected = y_train
+    for window, _ in cv.split(y_test.index):
+        expected = y_test.iloc[window].combine_first(expected)
+    np.testing.assert_array_equal(f._y.index, expected.index)
+    np.testing.assert_array_equal(f._y.values, expected.values)
+    assert f.cutoff == y_train.index[-1]
+
+
+def test_in_sample_predict_does_not_change_state():
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train, fh=[-2, -1, 0])
+    f.update(y_test.iloc[:5])
+
+    # in-sample predictions read the observed data after appended updates
+    state = f.__dict__.copy()
+    f.predict()
+    assert f.__dict__ == state
+
+
+def test_in_sample_predict_keeps_y():
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train)
+    y_before = f._y
+
+    # in-sample predictions replay observed data, which should not be copied
+    fh = -np.arange(len(y_train) - 1)
+    f.predict(fh)
+    assert f._y is y_before
+    assert f.cutoff == y_train.index[-1]
+
+
+def test_update_predict_without_get_n_splits():
+    class _Splitter(SlidingWindowSplitter):
+        def get_n_splits(self, y=None):
+            raise NotImplementedError()
+
+    cv = SlidingWindowSplitter(fh=[1, 2], window_length=1)
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train, fh=[1, 2])
+    expected = f.update_predict(y_test, cv=cv)
+
+    f.fit(y_train, fh=[1, 2])
+    cv = _Splitter(fh=[1, 2], window_length=1)
+    y_pred = f.update_predict(y_test, cv=cv)
+    pd.testing.assert_frame_equal(y_pred, expected)
+
+
+@pytest.mark.parametrize("columns", [["b", "a"], ["a", "b"]])
+@pytest.mark.parametrize("dtype", [float, int])
+def test_X_update_matches_combine_first(columns, dtype):
+    X = pd.DataFrame(np.arange(len(y) * 2, dtype=dtype).reshape(-1, 2),
+                     index=y.index, columns=["b", "a"])
+    X_train, X_test = X.loc[y_train.index], X.loc[y_test.index]
+
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train, X_train=X_train)
+
+    # strictly appended X, with the same or reordered columns
+    X_new = X_test.iloc[:5].loc[:, columns]
+    f.update(y_test.iloc[:5], X_new=X_new)
+    expected = X_new.combine_first(X_train)
+    pd.testing.assert_frame_equal(f._X, expected)
+
+
+def test_trusted_y_restored_after_update_predict():
+    cv = SlidingWindowSplitter(fh=1, window_length=1)
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train, fh=1)
+    f.update_predict(y_test, cv=cv)
+    assert not f._is_trusted_y
+
+    # flag is also restored if update fails inside the loop
+    def update(y_new, X_new=None, update_params=False):
+        assert f._is_trusted_y
+        raise RuntimeError()
+
+    f.update = update
+    with pytest.raises(RuntimeError):
+        f.update_predict(y_test, cv=cv)
+    assert not f._is_trusted_y
+
+
+def test_untrusted_update_rejects_unsorted_index():
+    f = NaiveForecaster(strategy="last")
+    f.fit(y_train)
+    with pytest.raises(ValueError):
+        f.update(y_test.iloc[::-1])
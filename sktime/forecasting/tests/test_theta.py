@@ -41,3 +41,23 @@ def test_pred_errors_against_y_test(fh):
     for ints in intervals:
         assert np.all(y_test > ints["lower"])
         assert np.all(y_test < ints["upper"])
+
+
+def test_pred_int_return_alpha_sorted():
+    y = load_airline()
+    y_train, _ = temporal_train_test_split(y)
+
+    f = ThetaForecaster()
+    f.fit(y_train, fh=[1, 2, 3])
+    y_pred = f.predict()
+
+    alpha = [0.1, 0.01, 0.05]
+    intervals = f.compute_pred_int(y_pred, alpha)
+    alphas, sorted_intervals = f.compute_pred_int(y_pred, alpha,
+                                                  return_alpha=True)
+
+    # returned alphas are sorted, with intervals in the same order
+    assert alphas == sorted(alpha)
+    for a, ints in zip(alphas, sorted_intervals):
+        expected = intervals[alpha.index(a)]
+        np.testing.assert_array_equal(ints, expected)
@@ -4,7 +4,6 @@ __author__ = ["@big-o", "Markus Löning"]
 from warnings import warn
 
 import numpy as np
-import pandas as pd
 from sktime.forecasting.base._base import DEFAULT_ALPHA
 from sktime.forecasting.exp_smoothing import ExponentialSmoothing
 from sktime.transformers.single_series.detrend import Deseasonalizer
@@ -182,7 +181,7 @@ class ThetaForecaster(ExponentialSmoothing):
             drift = self.trend_ * self.fh
         else:
             # Calculate drift from SES parameters
-            n_timepoints = len(self._y)
+            n_timepoints = self._n_timepoints
             drift = self.trend_ * (
                     self.fh
                     + (1 - (
@@ -198,19 +197,15 @@ class ThetaForecaster(ExponentialSmoothing):
         """
         self.check_is_fitted()
 
-        n_timepoints = len(self._y)
+        n_timepoints = self._n_timepoints
 
         self.sigma_ = np.sqrt(self._fitted_forecaster.sse / (n_timepoints - 1))
         sem = self.sigma_ * np.sqrt(self._fh * self.smoothing_level_ ** 2 + 1)
 
-        errors = []
-        for alpha in alphas:
-            z = zscore(1 - alpha)
-            error = z * sem
-            errors.append(
-                pd.Series(error, index=self.fh.absolute(self.cutoff)))
-
-        return errors
+        # compute z scores for all alphas at once, with one column of
+        # errors per alpha
+        z = zscore(1 - np.asarray(alphas))
+        return np.outer(sem, z)
 
     def update(self, y_new, X_new=None, update_params=True):
         super(ThetaForecaster, self).update(y_new, X_new=X_new,
@@ -269,12 +269,25 @@ def check_alpha(alpha):
     """
     # check type
     if isinstance(alpha, list):
-        if not all(isinstance(a, float) for a in alpha):
-            raise ValueError("When `alpha` is passed as a list, "
-                             "it must be a list of floats")
-
-    elif isinstance(alpha, float):
-        alpha = [alpha]  # make iterable
+        msg = "When `alpha` is passed as a list, it must be a list of floats"
+        if any(isinstance(a, (str, bytes)) for a in alpha):
+            raise ValueError(msg)
+        # cast Python and NumPy scalars alike, as for a single alpha
+        try:
+            alpha = [float(a) for a in alpha]
+        except TypeError:
+            raise ValueError(msg)
+
+    elif np.ndim(alpha) == 0:
+        msg = (f"`alpha` must be a float or a list of floats, "
+               f"but found: {type(alpha)}")
+        if isinstance(alpha, (str, bytes)):
+            raise ValueError(msg)
+        # make iterable, casting Python and NumPy scalars alike
+        try:
+            alpha = [float(alpha)]
+        except TypeError:
+            raise ValueError(msg)
 
     # check range
     for a in alpha:
@@ -1,10 +1,16 @@
 __author__ = ["Markus Löning"]
-__all__ = ["test_check_fh_bad_input_args"]
+__all__ = [
+    "test_check_fh_bad_input_args",
+    "test_check_alpha_scalar_input_args",
+    "test_check_alpha_list_input_args",
+    "test_check_alpha_bad_input_args",
+]
 
 import numpy as np
 import pytest
 from pytest import raises
 
+from sktime.utils.validation.forecasting import check_alpha
 from sktime.utils.validation.forecasting import check_fh_values
 
 bad_input_args = (
@@ -26,3 +32,47 @@ bad_input_args = (
 def test_check_fh_bad_input_args(arg):
     with raises(TypeError):
         check_fh_values(arg)
+
+
+scalar_alphas = (
+    0.1,  # float
+    np.float32(0.1),  # numpy float
+    np.float64(0.1),  # numpy double
+    np.array(0.1),  # 0-d array
+)
+
+
+@pytest.mark.parametrize("alpha", scalar_alphas)
+def test_check_alpha_scalar_input_args(alpha):
+    alphas = check_alpha(alpha)
+    assert isinstance(alphas, list)
+    assert len(alphas) == 1
+    np.testing.assert_almost_equal(alphas[0], 0.1)
+
+
+list_alphas = (
+    [0.1],  # list of float
+    [np.float32(0.1)],  # list of numpy float
+)
+
+
+@pytest.mark.parametrize("alpha", list_alphas)
+def test_check_alpha_list_input_args(alpha):
+    alphas = check_alpha(alpha)
+    assert isinstance(alphas, list)
+    assert len(alphas) == 1
+    np.testing.assert_almost_equal(alphas[0], 0.1)
+
+
+bad_alphas = (
+    "0.1",  # string
+    b"0.1",  # bytes
+    ["0.1"],  # string in list
+    [b"0.1"],  # bytes in list
+)
+
+
+@pytest.mark.parametrize("alpha", bad_alphas)
+def test_check_alpha_bad_input_args(alpha):
+    with raises(ValueError):
+        check_alpha(alpha)